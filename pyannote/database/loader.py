@@ -90,7 +90,7 @@ def load_trial(file_trial):
     """
 
     trials = pd.read_table(
-        file_trial, sep="\s+", names=["reference", "uri1", "uri2"]
+        file_trial, sep=r"\s+", names=["reference", "uri1", "uri2"]
     )
 
     for _, reference, uri1, uri2 in trials.itertuples():
@@ -289,7 +289,7 @@ class CTMLoader:
             "confidence": float,
         }
         self.data_ = pd.read_csv(
-            ctm, names=names, dtype=dtype, sep="\s+"
+            ctm, names=names, dtype=dtype, sep=r"\s+"
         ).groupby("uri")
 
     def __call__(self, current_file: ProtocolFile) -> Union["Doc", None]:
@@ -305,17 +305,20 @@ class CTMLoader:
         uri = current_file["uri"]
 
         try:
-            lines = list(self.data_.get_group(uri).iterrows())
+            turns = self.data_.get_group(uri)
         except KeyError:
             lines = []
+        else:
+            columns = ["word", "start", "duration", "confidence"]
+            lines = list(turns[columns].itertuples(index=False, name=None))
 
-        words = [line.word for _, line in lines]
+        words = [word for word, _, _, _ in lines]
         doc = Doc(Vocab(), words=words)
 
-        for token, (_, line) in zip(doc, lines):
-            token._.time_start = line.start
-            token._.time_end = line.start + line.duration
-            token._.confidence = line.confidence
+        for token, (_, start, duration, confidence) in zip(doc, lines):
+            token._.time_start = start
+            token._.time_end = start + duration
+            token._.confidence = confidence
 
         return doc
 
@@ -354,7 +357,7 @@ class MAPLoader:
             "uri": str,
         }
         self.data_ = pd.read_csv(
-            mapping, names=names, dtype=dtype, sep="\s+"
+            mapping, names=names, dtype=dtype, sep=r"\s+"
         )
 
         # get colum 'value' dtype, allowing us to acces it during subset
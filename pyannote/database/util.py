@@ -26,9 +26,12 @@
 # AUTHORS
 # Hervé BREDIN - http://herve.niderb.fr
 
+import itertools
+import pickle
 import yaml
 from pathlib import Path
 import warnings
+import numpy as np
 import pandas as pd
 from pyannote.core import Segment, Timeline, Annotation
 from .protocol.protocol import ProtocolFile
@@ -60,18 +63,16 @@ def get_unique_identifier(item):
         Unique item identifier
     """
 
-    IDENTIFIER = ""
+    database = item.get("database")
+    channel = item.get("channel")
+    uri = item["uri"]
 
-    # {database}/{uri}_{channel}
-    database = item.get("database", None)
-    if database is not None:
-        IDENTIFIER += f"{database}/"
-    IDENTIFIER += item["uri"]
-    channel = item.get("channel", None)
-    if channel is not None:
-        IDENTIFIER += f"_{channel:d}"
-
-    return IDENTIFIER
+    # {database}/{uri}_{channel}, built with a single format per case
+    if channel is None:
+        return uri if database is None else f"{database}/{uri}"
+    if database is None:
+        return f"{uri}_{channel:d}"
+    return f"{database}/{uri}_{channel:d}"
 
 
 # This function is used in custom.py
@@ -100,6 +101,8 @@ def get_annotated(current_file):
     # try and use wav duration
 
     if "duration" in current_file:
+        # "duration" may be a lazy preprocessor relying on optional
+        # (audio) dependencies, hence the ImportError
         try:
             duration = current_file["duration"]
         except ImportError:
@@ -145,7 +148,87 @@ def get_label_identifier(label, current_file):
     return database + "|" + label
 
 
-def load_rttm(file_rttm, keep_type="SPEAKER"):
+def _group_by_uri(uris):
+    """Iterate over groups of rows sharing the same uri
+
+    Parameters
+    ----------
+    uris : np.ndarray
+        (num_rows, ) array of uris.
+
+    Yields
+    ------
+    uri : str
+        Group uri.
+    rows : np.ndarray
+        Sorted indices of rows with this uri. Rows with missing uri are skipped.
+    """
+
+    # integer codes are much cheaper to sort than strings. sort=True yields
+    # uris in sorted order, like DataFrame.groupby("uri") used to.
+    codes, unique_uris = pd.factorize(uris, sort=True)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(unique_uris) + 1))
+    for uri, start, end in zip(unique_uris.tolist(), bounds[:-1], bounds[1:]):
+        yield uri, order[start:end]
+
+
+# whitespace-separated formats (RTTM, MDTM, STM, LAB) share these options
+_READ_CSV_KWARGS = {"sep": r"\s+", "engine": "c", "na_filter": False}
+
+
+def _build_annotations(uris, starts, ends, labels, keep=None):
+    """Build one annotation per uri from column arrays
+
+    Parameters
+    ----------
+    uris, starts, ends, labels : np.ndarray
+        (num_rows, ) arrays of uris, start times, end times and labels.
+    keep : np.ndarray, optional
+        (num_rows, ) boolean mask of rows to keep. Uris whose rows are all
+        discarded still get an (empty) annotation. Defaults to keeping all rows.
+
+    Returns
+    -------
+    annotations : `dict`
+        {uri: pyannote.core.Annotation} dictionary, using row indices as tracks.
+    """
+
+    annotations = dict()
+    for uri, rows in _group_by_uri(uris):
+        if keep is not None:
+            rows = rows[keep[rows]]
+        annotations[uri] = _build_annotation(
+            rows, starts[rows], ends[rows], labels[rows], uri=uri
+        )
+
+    return annotations
+
+
+def _build_annotation(tracks, starts, ends, labels, uri=None):
+    """Build annotation from column arrays
+
+    Parameters
+    ----------
+    tracks, starts, ends, labels : np.ndarray
+        (num_tracks, ) arrays of track names, start times, end times and labels.
+    uri : str, optional
+        Annotation uri.
+
+    Returns
+    -------
+    annotation : `pyannote.core.Annotation`
+    """
+
+    # map(), zip() and compress() keep the per-track loop in C
+    segments = list(map(Segment, starts.tolist(), ends.tolist()))
+    records = zip(segments, tracks.tolist(), labels.tolist())
+    # like annotation[segment, track] = label, do not add empty tracks
+    records = itertools.compress(records, segments)
+    return Annotation.from_records(records, uri=uri)
+
+
+def load_rttm(file_rttm, keep_type="SPEAKER", cache: bool = False):
     """Load RTTM file
 
     Parameter
@@ -155,6 +238,10 @@ def load_rttm(file_rttm, keep_type="SPEAKER"):
     keep_type : str, optional
         Only keep lines with this type (field #1 in RTTM specs).
         Defaults to "SPEAKER".
+    cache : bool, optional
+        Store loaded annotations in a "{file_rttm}.pkl" sidecar file, and load
+        them from there on subsequent calls, as long as it is more recent than
+        the RTTM file. Defaults to False.
 
     Returns
     -------
@@ -162,6 +249,34 @@ def load_rttm(file_rttm, keep_type="SPEAKER"):
         Speaker diarization as a {uri: pyannote.core.Annotation} dictionary.
     """
 
+    if not cache:
+        return _load_rttm(file_rttm, keep_type=keep_type)
+
+    file_pkl = Path(f"{file_rttm}.pkl")
+    try:
+        if file_pkl.stat().st_mtime >= Path(file_rttm).stat().st_mtime:
+            cached_keep_type, annotations = pickle.loads(file_pkl.read_bytes())
+            if cached_keep_type == keep_type and isinstance(annotations, dict):
+                return annotations
+    # missing, corrupt or stale (e.g. pickled by other library versions)
+    # cache: fall back to parsing the RTTM file
+    except Exception:
+        pass
+
+    annotations = _load_rttm(file_rttm, keep_type=keep_type)
+
+    try:
+        file_pkl.write_bytes(
+            pickle.dumps((keep_type, annotations), protocol=pickle.HIGHEST_PROTOCOL)
+        )
+    except OSError:
+        msg = f'Could not write RTTM cache to "{file_pkl}".'
+        warnings.warn(msg)
+
+    return annotations
+
+
+def _load_rttm(file_rttm, keep_type="SPEAKER"):
     names = [
         "type",
         "uri",
@@ -174,26 +289,26 @@ def load_rttm(file_rttm, keep_type="SPEAKER"):
         "NA5",
         "NA6",
     ]
-    dtype = {"uri": str, "start": float, "duration": float, "speaker": str}
+    dtype = {
+        "type": str,
+        "uri": str,
+        "start": float,
+        "duration": float,
+        "speaker": str,
+    }
     data = pd.read_csv(
         file_rttm,
         names=names,
         dtype=dtype,
-        sep="\s+",
-        keep_default_na=True,
+        **_READ_CSV_KWARGS,
     )
 
-    annotations = dict()
-    for uri, turns in data.groupby("uri"):
-        annotation = Annotation(uri=uri)
-        for i, turn in turns.iterrows():
-            if turn.type != keep_type:
-                continue
-            segment = Segment(turn.start, turn.start + turn.duration)
-            annotation[segment, i] = turn.speaker
-        annotations[uri] = annotation
+    keep = data["type"].to_numpy() == keep_type
+    starts = data["start"].to_numpy()
+    ends = starts + data["duration"].to_numpy()
+    speakers = data["speaker"].to_numpy()
 
-    return annotations
+    return _build_annotations(data["uri"].to_numpy(), starts, ends, speakers, keep=keep)
 
 
 def load_stm(file_stm):
@@ -213,21 +328,17 @@ def load_stm(file_stm):
     dtype = {"uri": str, "speaker": str, "start": float, "end": float}
     data = pd.read_csv(
         file_stm,
-        sep="\s+",
         usecols=[0, 2, 3, 4],
         dtype=dtype,
         names=list(dtype),
+        **_READ_CSV_KWARGS,
     )
 
-    annotations = dict()
-    for uri, turns in data.groupby("uri"):
-        annotation = Annotation(uri=uri)
-        for i, turn in turns.iterrows():
-            segment = Segment(turn.start, turn.end)
-            annotation[segment, i] = turn.speaker
-        annotations[uri] = annotation
+    starts = data["start"].to_numpy()
+    ends = data["end"].to_numpy()
+    speakers = data["speaker"].to_numpy()
 
-    return annotations
+    return _build_annotations(data["uri"].to_numpy(), starts, ends, speakers)
 
 
 def load_mdtm(file_mdtm):
@@ -250,19 +361,14 @@ def load_mdtm(file_mdtm):
         file_mdtm,
         names=names,
         dtype=dtype,
-        sep="\s+",
-        keep_default_na=False,
+        **_READ_CSV_KWARGS,
     )
 
-    annotations = dict()
-    for uri, turns in data.groupby("uri"):
-        annotation = Annotation(uri=uri)
-        for i, turn in turns.iterrows():
-            segment = Segment(turn.start, turn.start + turn.duration)
-            annotation[segment, i] = turn.speaker
-        annotations[uri] = annotation
+    starts = data["start"].to_numpy()
+    ends = starts + data["duration"].to_numpy()
+    speakers = data["speaker"].to_numpy()
 
-    return annotations
+    return _build_annotations(data["uri"].to_numpy(), starts, ends, speakers)
 
 
 def load_uem(file_uem):
@@ -279,16 +385,19 @@ def load_uem(file_uem):
         Evaluation map as a {uri: pyannote.core.Timeline} dictionary.
     """
 
-    names = ["uri", "NA1", "start", "end"]
-    dtype = {"uri": str, "start": float, "end": float}
-    data = pd.read_csv(file_uem, names=names, dtype=dtype, sep="\s+")
-
-    timelines = dict()
-    for uri, parts in data.groupby("uri"):
-        segments = [Segment(part.start, part.end) for i, part in parts.iterrows()]
-        timelines[uri] = Timeline(segments=segments, uri=uri)
+    segments = dict()
+    with open(file_uem, mode="r") as fp:
+        for line in fp:
+            fields = line.split()
+            if not fields:
+                continue
+            uri, _, start, end, *left = fields
+            segments.setdefault(uri, []).append(Segment(float(start), float(end)))
 
-    return timelines
+    # sorted by uri, like the other loaders
+    return {
+        uri: Timeline(segments=segments[uri], uri=uri) for uri in sorted(segments)
+    }
 
 
 def load_lab(path, uri: str = None) -> Annotation:
@@ -306,14 +415,13 @@ def load_lab(path, uri: str = None) -> Annotation:
 
     names = ["start", "end", "label"]
     dtype = {"start": float, "end": float, "label": str}
-    data = pd.read_csv(path, names=names, dtype=dtype, sep="\s+")
+    data = pd.read_csv(path, names=names, dtype=dtype, **_READ_CSV_KWARGS)
 
-    annotation = Annotation(uri=uri)
-    for i, turn in data.iterrows():
-        segment = Segment(turn.start, turn.end)
-        annotation[segment, i] = turn.label
+    starts = data["start"].to_numpy()
+    ends = data["end"].to_numpy()
+    labels = data["label"].to_numpy()
 
-    return annotation
+    return _build_annotation(np.arange(len(data)), starts, ends, labels, uri=uri)
 
 
 def load_lst(file_lst):
@@ -333,8 +441,7 @@ def load_lst(file_lst):
     """
 
     with open(file_lst, mode="r") as fp:
-        lines = fp.readlines()
-    return [line.strip() for line in lines]
+        return [line.strip() for line in fp]
 
 
 def load_mapping(mapping_txt):
@@ -351,13 +458,11 @@ def load_mapping(mapping_txt):
         {1st field: 2nd field} dictionary
     """
 
-    with open(mapping_txt, mode="r") as fp:
-        lines = fp.readlines()
-
     mapping = dict()
-    for line in lines:
-        key, value, *left = line.strip().split()
-        mapping[key] = value
+    with open(mapping_txt, mode="r") as fp:
+        for line in fp:
+            key, value, *left = line.split()
+            mapping[key] = value
 
     return mapping
 
@@ -389,9 +494,9 @@ class LabelMapper(object):
 
     def __call__(self, current_file):
         if not self.keep_missing:
-            missing = set(current_file["annotation"].labels()) - set(self.mapping)
-            if missing and not self.keep_missing:
-                label = missing.pop()
+            for label in current_file["annotation"].labels():
+                if label in self.mapping:
+                    continue
                 msg = (
                     f'No mapping found for label "{label}". Set "keep_missing" '
                     f"to True to keep labels with no mapping."
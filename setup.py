@@ -36,7 +36,8 @@ setup(
     install_requires=[
         "pyannote.core >= 4.1",
         "pyYAML >= 3.12",
-        "pandas >= 0.19",
+        "numpy >= 1.15",
+        "pandas >= 0.24",
         "typer >= 0.12.1",
         "typing_extensions >= 3.7.4;python_version < '3.8'",
     ],
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2025- CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+import pytest
+
+from pyannote.database.loader import CTMLoader
+
+
+def test_ctm_loader(tmp_path):
+    pytest.importorskip("spacy")
+
+    ctm = tmp_path / "file.ctm"
+    ctm.write_text(
+        "uri1 1 0.5 1.0 hello 0.9\n"
+        "uri2 1 0.0 2.0 other 0.5\n"
+        "uri1 1 1.5 0.5 world 0.8\n"
+    )
+    loader = CTMLoader(ctm)
+
+    doc = loader({"uri": "uri1"})
+    assert [token.text for token in doc] == ["hello", "world"]
+    assert [token._.time_start for token in doc] == [0.5, 1.5]
+    assert [token._.time_end for token in doc] == [1.5, 2.0]
+    assert [token._.confidence for token in doc] == [0.9, 0.8]
+
+    assert len(loader({"uri": "uri3"})) == 0
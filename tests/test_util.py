@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2025- CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+import os
+import pickle
+
+import pytest
+from pyannote.core import Annotation, Segment
+
+from pyannote.database.util import (
+    LabelMapper,
+    get_unique_identifier,
+    load_lab,
+    load_mdtm,
+    load_rttm,
+    load_stm,
+    load_uem,
+)
+
+
+def tracks(annotation):
+    return list(annotation.itertracks(yield_label=True))
+
+
+def test_load_rttm(tmp_path):
+    rttm = tmp_path / "file.rttm"
+    rttm.write_text(
+        "SPEAKER uri1 1 0.5 1.0 <NA> <NA> A <NA> <NA>\n"
+        "NOSCORE uri1 1 2.0 1.0 <NA> <NA> B <NA> <NA>\n"
+        "SPEAKER uri2 1 0.0 2.0 <NA> <NA> B <NA> <NA>\n"
+        "SPEAKER uri1 1 3.0 0.5 <NA> <NA> C <NA> <NA>\n"
+        "NOSCORE uri3 1 0.0 1.0 <NA> <NA> A <NA> <NA>\n"
+        "SPEAKER uri2 1 3.0 0.0 <NA> <NA> D <NA> <NA>\n"
+    )
+
+    annotations = load_rttm(rttm)
+    assert set(annotations) == {"uri1", "uri2", "uri3"}
+    assert annotations["uri1"].uri == "uri1"
+    assert tracks(annotations["uri1"]) == [
+        (Segment(0.5, 1.5), 0, "A"),
+        (Segment(3.0, 3.5), 3, "C"),
+    ]
+    assert tracks(annotations["uri2"]) == [(Segment(0.0, 2.0), 2, "B")]
+    assert annotations["uri2"].labels() == ["B"]
+    assert not annotations["uri3"]
+
+    annotations = load_rttm(rttm, keep_type="NOSCORE")
+    assert tracks(annotations["uri1"]) == [(Segment(2.0, 3.0), 1, "B")]
+    assert not annotations["uri2"]
+
+
+def test_load_rttm_na_label(tmp_path):
+    rttm = tmp_path / "file.rttm"
+    rttm.write_text("SPEAKER uri1 1 0.5 1.0 <NA> <NA> NA <NA> <NA>\n")
+
+    annotations = load_rttm(rttm)
+    assert tracks(annotations["uri1"]) == [(Segment(0.5, 1.5), 0, "NA")]
+
+
+def test_load_rttm_short_rows(tmp_path):
+    rttm = tmp_path / "file.rttm"
+    rttm.write_text(
+        "SPEAKER uri1 1 0.5 1.0 <NA> <NA> A\n"
+        "SPEAKER uri1 1 2.0 1.0 <NA> <NA> B <NA>\n"
+    )
+
+    annotations = load_rttm(rttm)
+    assert tracks(annotations["uri1"]) == [
+        (Segment(0.5, 1.5), 0, "A"),
+        (Segment(2.0, 3.0), 1, "B"),
+    ]
+
+
+def test_load_mdtm(tmp_path):
+    mdtm = tmp_path / "file.mdtm"
+    mdtm.write_text(
+        "uri1 1 0.5 1.0 speaker NA unknown A\n"
+        "uri2 1 0.0 2.0 speaker NA unknown B\n"
+    )
+
+    annotations = load_mdtm(mdtm)
+    assert tracks(annotations["uri1"]) == [(Segment(0.5, 1.5), 0, "A")]
+    assert tracks(annotations["uri2"]) == [(Segment(0.0, 2.0), 1, "B")]
+
+
+def test_load_stm(tmp_path):
+    stm = tmp_path / "file.stm"
+    stm.write_text(
+        "uri2 1 B 0.0 2.0 <o,f0,male> world\n"
+        "uri1 1 A 0.5 1.5 <o,f0,male> hello\n"
+    )
+
+    annotations = load_stm(stm)
+    assert list(annotations) == ["uri1", "uri2"]
+    assert tracks(annotations["uri1"]) == [(Segment(0.5, 1.5), 1, "A")]
+    assert tracks(annotations["uri2"]) == [(Segment(0.0, 2.0), 0, "B")]
+
+
+def test_load_uem(tmp_path):
+    uem = tmp_path / "file.uem"
+    uem.write_text("uri2 1 0.0 2.0\nuri1 1 0.0 1.0\nuri1 1 2.0 3.0\n")
+
+    timelines = load_uem(uem)
+    assert list(timelines) == ["uri1", "uri2"]
+    assert timelines["uri1"].uri == "uri1"
+    assert list(timelines["uri1"]) == [Segment(0.0, 1.0), Segment(2.0, 3.0)]
+    assert list(timelines["uri2"]) == [Segment(0.0, 2.0)]
+
+
+def test_load_lab(tmp_path):
+    lab = tmp_path / "file.lab"
+    lab.write_text("0.0 1.0 sing\n1.0 1.5 nosing\n1.5 1.5 empty\n")
+
+    annotation = load_lab(lab, uri="uri1")
+    assert annotation.uri == "uri1"
+    assert tracks(annotation) == [
+        (Segment(0.0, 1.0), 0, "sing"),
+        (Segment(1.0, 1.5), 1, "nosing"),
+    ]
+    assert annotation.labels() == ["nosing", "sing"]
+
+
+def test_load_rttm_cache(tmp_path):
+    rttm = tmp_path / "file.rttm"
+    rttm.write_text("SPEAKER uri1 1 0.5 1.0 <NA> <NA> A <NA> <NA>\n")
+    pkl = tmp_path / "file.rttm.pkl"
+
+    annotations = load_rttm(rttm, cache=True)
+    assert pkl.is_file()
+    assert load_rttm(rttm, cache=True) == annotations
+
+    # cache is specific to "keep_type"
+    assert not load_rttm(rttm, keep_type="NOSCORE", cache=True)["uri1"]
+
+    # cache is invalidated when RTTM file is more recent
+    rttm.write_text("SPEAKER uri1 1 0.5 2.0 <NA> <NA> A <NA> <NA>\n")
+    mtime = pkl.stat().st_mtime + 1
+    os.utime(rttm, (mtime, mtime))
+    annotations = load_rttm(rttm, cache=True)
+    assert tracks(annotations["uri1"]) == [(Segment(0.5, 2.5), 0, "A")]
+
+
+def test_load_rttm_corrupt_cache(tmp_path):
+    rttm = tmp_path / "file.rttm"
+    rttm.write_text("SPEAKER uri1 1 0.5 1.0 <NA> <NA> A <NA> <NA>\n")
+    pkl = tmp_path / "file.rttm.pkl"
+
+    for payload in [b"garbage", pickle.dumps(0), pickle.dumps(("SPEAKER", 0))]:
+        pkl.write_bytes(payload)
+        mtime = rttm.stat().st_mtime + 1
+        os.utime(pkl, (mtime, mtime))
+        annotations = load_rttm(rttm, cache=True)
+        assert tracks(annotations["uri1"]) == [(Segment(0.5, 1.5), 0, "A")]
+
+
+def test_label_mapper():
+    annotation = Annotation(uri="uri1")
+    annotation[Segment(0.0, 1.0)] = "A"
+    annotation[Segment(1.0, 2.0)] = "B"
+
+    mapper = LabelMapper({"A": "X", "B": "Y"})
+    assert mapper({"annotation": annotation}).labels() == ["X", "Y"]
+
+    mapper = LabelMapper({"A": "X"})
+    with pytest.raises(ValueError, match='"B"'):
+        mapper({"annotation": annotation})
+
+    mapper = LabelMapper({"A": "X"}, keep_missing=True)
+    assert mapper({"annotation": annotation}).labels() == ["B", "X"]
+
+
+def test_get_unique_identifier():
+    assert get_unique_identifier({"uri": "uri1"}) == "uri1"
+    assert get_unique_identifier({"uri": "uri1", "database": "DB"}) == "DB/uri1"
+    assert get_unique_identifier({"uri": "uri1", "channel": 1}) == "uri1_1"
+    item = {"uri": "uri1", "database": "DB", "channel": 2}
+    assert get_unique_identifier(item) == "DB/uri1_2"
+
+    with pytest.raises(ValueError):
+        get_unique_identifier({"uri": "uri1", "channel": "A"})